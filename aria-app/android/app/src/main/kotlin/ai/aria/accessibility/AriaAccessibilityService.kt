@@ -236,7 +236,13 @@ class AriaAccessibilityService : AccessibilityService() {
     /**
      * Get the package name of the currently active app.
      */
-    fun getCurrentApp(): String = rootInActiveWindow?.packageName?.toString() ?: ""
+    fun getCurrentApp(): String {
+        return rootInActiveWindow?.let { root ->
+            val packageName = root.packageName?.toString() ?: ""
+            root.recycle()
+            packageName
+        } ?: ""
+    }
 
     /**
      * Get the title of the currently active window.
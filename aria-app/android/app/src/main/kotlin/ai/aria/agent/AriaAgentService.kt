@@ -14,10 +14,14 @@ import ai.aria.os.BuildConfig
 import ai.aria.os.MainActivity
 import ai.aria.os.llm.ClaudeClient
 import ai.aria.os.llm.Message
+import ai.aria.os.llm.ToolCall
 import ai.aria.os.memory.AriaDatabase
 import ai.aria.os.memory.ConversationMessage
+import ai.aria.os.net.SharedHttpClient
 import ai.aria.os.voice.AriaVoice
 import kotlinx.coroutines.Dispatchers
+import kotlinx.coroutines.async
+import kotlinx.coroutines.coroutineScope
 import kotlinx.coroutines.launch
 import kotlinx.coroutines.withContext
 
@@ -53,7 +57,7 @@ class AriaAgentService : LifecycleService() {
         createNotificationChannel()
         startForeground(NOTIF_ID, buildNotification("Aria is ready"))
 
-        claudeClient = ClaudeClient(getApiKey())
+        claudeClient = ClaudeClient(getApiKey(), SharedHttpClient.instance)
         toolRegistry = ToolRegistry(this)
         db = AriaDatabase.getInstance(this)
         ariaVoice = AriaVoice(this)
@@ -88,10 +92,16 @@ class AriaAgentService : LifecycleService() {
                 // Add to in-memory history
                 conversationHistory.add(Message("user", text))
 
-                // Persist to DB
-                db.conversationDao().insert(
-                    ConversationMessage(role = "user", content = text)
-                )
+                // Persist to DB alongside the LLM call; the write isn't needed until the reply is stored
+                val persistUserMessage = lifecycleScope.launch(Dispatchers.IO) {
+                    try {
+                        db.conversationDao().insert(
+                            ConversationMessage(role = "user", content = text)
+                        )
+                    } catch (e: Exception) {
+                        Log.e(TAG, "Failed to persist user message", e)
+                    }
+                }
 
                 // First LLM call: may return tool calls
                 val apiKey = getApiKey()
@@ -104,36 +114,33 @@ class AriaAgentService : LifecycleService() {
 
                 claudeClient.updateApiKey(apiKey)
 
-                var response = claudeClient.chat(
+                // Stream each LLM call so Aria starts speaking at the first full sentence
+                var response = claudeClient.chatStream(
                     messages = conversationHistory,
                     tools = toolRegistry.getToolSchemas(),
-                    systemPrompt = buildSystemPrompt()
+                    systemPrompt = buildSystemPrompt(),
+                    onText = ariaVoice::speakStreamed
                 )
 
                 // Agentic loop: keep processing tool calls until we get a final text response
                 var loopCount = 0
+                // Text spoken alongside tool calls ("I'll check the weather…"), shown with the reply
+                val preambles = mutableListOf<String>()
                 while (response.toolCalls != null && response.toolCalls!!.isNotEmpty() && loopCount < 5) {
                     loopCount++
                     Log.d(TAG, "Tool call loop $loopCount: ${response.toolCalls!!.map { it.name }}")
 
-                    // Add assistant's tool_use turn to history
+                    // Speak any preamble tail now rather than joining it onto the next response
+                    ariaVoice.flushStreamed()
+
+                    // Add assistant's tool_use turn to history, with any text Claude already said
+                    response.text?.let(preambles::add)
                     conversationHistory.add(
-                        Message(role = "assistant", content = "", toolCalls = response.toolCalls)
+                        Message(role = "assistant", content = response.text ?: "", toolCalls = response.toolCalls)
                     )
 
                     // Execute each tool call
-                    val toolResults = mutableListOf<Message.ToolResult>()
-                    response.toolCalls!!.forEach { toolCall ->
-                        Log.d(TAG, "Executing tool: ${toolCall.name} with input: ${toolCall.input}")
-                        val tool = toolRegistry.getTool(toolCall.name)
-                        val toolResult = try {
-                            tool?.execute(toolCall.input) ?: "Error: Tool '${toolCall.name}' not found"
-                        } catch (e: Exception) {
-                            Log.e(TAG, "Tool ${toolCall.name} failed", e)
-                            "Error executing ${toolCall.name}: ${e.message}"
-                        }
-                        toolResults.add(Message.ToolResult(toolCall.id, toolResult))
-                    }
+                    val toolResults = executeToolCalls(response.toolCalls!!)
 
                     // Add tool results to history
                     conversationHistory.add(
@@ -141,25 +148,35 @@ class AriaAgentService : LifecycleService() {
                     )
 
                     // Next LLM call
-                    response = claudeClient.chat(
+                    response = claudeClient.chatStream(
                         messages = conversationHistory,
                         tools = toolRegistry.getToolSchemas(),
-                        systemPrompt = buildSystemPrompt()
+                        systemPrompt = buildSystemPrompt(),
+                        onText = ariaVoice::speakStreamed
                     )
                 }
 
                 // Final text response
-                val reply = response.text ?: "I completed the action but have nothing more to add."
+                // The fallback goes through the stream too, so it queues behind any spoken preamble
+                val reply = response.text
+                    ?: "I completed the action but have nothing more to add.".also(ariaVoice::speakStreamed)
                 conversationHistory.add(Message("assistant", reply))
 
-                // Persist assistant reply
+                // Most of the reply is already being spoken; finish its last sentence before the
+                // DB work, and only speak it whole if nothing streamed
+                if (!ariaVoice.finishStreamed()) ariaVoice.speak(reply)
+
+                // The transcript shows everything Aria said this turn, not just the final text
+                val transcript = (preambles + reply).joinToString("\n\n")
+
+                // Persist assistant reply (after the user message, so history stays ordered)
+                persistUserMessage.join()
                 db.conversationDao().insert(
-                    ConversationMessage(role = "assistant", content = reply)
+                    ConversationMessage(role = "assistant", content = transcript)
                 )
 
                 withContext(Dispatchers.Main) {
-                    broadcastReply(reply)
-                    ariaVoice.speak(reply)
+                    broadcastReply(transcript)
                     updateNotification("Aria is ready")
                 }
 
@@ -175,16 +192,44 @@ class AriaAgentService : LifecycleService() {
         }
     }
 
-    private fun buildSystemPrompt(): String = """
+    /**
+     * Run one turn's tool calls. Tools that allow it start concurrently up front;
+     * the rest run one at a time in Claude's order. Results keep the request order.
+     */
+    private suspend fun executeToolCalls(toolCalls: List<ToolCall>): List<Message.ToolResult> = coroutineScope {
+        val concurrent = toolCalls
+            .filter { toolRegistry.getTool(it.name)?.runsConcurrently == true }
+            .associate { it.id to async { executeTool(it) } }
+
+        toolCalls.map { toolCall ->
+            val toolResult = concurrent[toolCall.id]?.await() ?: executeTool(toolCall)
+            Message.ToolResult(toolCall.id, toolResult)
+        }
+    }
+
+    private suspend fun executeTool(toolCall: ToolCall): String {
+        Log.d(TAG, "Executing tool: ${toolCall.name} with input: ${toolCall.input}")
+        val tool = toolRegistry.getTool(toolCall.name)
+        return try {
+            tool?.execute(toolCall.input) ?: "Error: Tool '${toolCall.name}' not found"
+        } catch (e: Exception) {
+            Log.e(TAG, "Tool ${toolCall.name} failed", e)
+            "Error executing ${toolCall.name}: ${e.message}"
+        }
+    }
+
+    // Device info can't change while the process runs, so only the timestamp is rebuilt per call
+    private val systemPromptBase = """
         You are Aria, an AI assistant running natively on this Android device.
         You have direct access to the device's capabilities through tools.
         Be concise, helpful, and action-oriented.
         When the user asks you to do something, use your tools to actually do it — don't just describe how to do it.
         After using a tool, briefly confirm what you did.
         Device info: Android ${Build.VERSION.RELEASE} on ${Build.MODEL}.
-        Current time: ${java.util.Date()}.
     """.trimIndent()
 
+    private fun buildSystemPrompt(): String = "$systemPromptBase\nCurrent time: ${java.util.Date()}."
+
     private fun broadcastReply(text: String) {
         val intent = Intent(ACTION_REPLY).apply {
             putExtra("text", text)
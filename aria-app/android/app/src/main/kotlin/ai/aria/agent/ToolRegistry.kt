@@ -21,9 +21,8 @@ class ToolRegistry(private val context: Context) {
         "web_search" to WebSearchTool(context),
     )
 
-    fun getTool(name: String): AriaTool? = tools[name]
-
-    fun getToolSchemas(): List<Map<String, Any>> = tools.map { (name, tool) ->
+    // Schemas are fixed for the registry's lifetime, so build them once
+    private val toolSchemas: List<Map<String, Any>> = tools.map { (name, tool) ->
         mapOf(
             "name" to name,
             "description" to tool.description,
@@ -31,5 +30,9 @@ class ToolRegistry(private val context: Context) {
         )
     }
 
+    fun getTool(name: String): AriaTool? = tools[name]
+
+    fun getToolSchemas(): List<Map<String, Any>> = toolSchemas
+
     fun listTools(): List<String> = tools.keys.toList()
 }
@@ -10,6 +10,10 @@ import okhttp3.MediaType.Companion.toMediaType
 import okhttp3.OkHttpClient
 import okhttp3.Request
 import okhttp3.RequestBody.Companion.toRequestBody
+import okhttp3.Response
+import okio.BufferedSource
+import kotlinx.coroutines.Dispatchers
+import kotlinx.coroutines.withContext
 import java.io.IOException
 import java.util.concurrent.TimeUnit
 
@@ -20,8 +24,14 @@ import java.util.concurrent.TimeUnit
  * - Serializing conversation history + tools to Anthropic's API format
  * - Parsing text and tool_use blocks from the response
  * - Proper agentic tool-result message format
+ *
+ * Pass a [baseClient] to share its connection pool and dispatcher threads; the
+ * Claude-specific timeouts are layered on top via newBuilder().
  */
-class ClaudeClient(private var apiKey: String) {
+class ClaudeClient(
+    private var apiKey: String,
+    baseClient: OkHttpClient = OkHttpClient()
+) {
 
     companion object {
         const val TAG = "ClaudeClient"
@@ -33,7 +43,16 @@ class ClaudeClient(private var apiKey: String) {
 
     private val gson = Gson()
 
-    private val client = OkHttpClient.Builder()
+    // Full request/response bodies run to many KB per call; only write them when
+    // enabled via `adb shell setprop log.tag.ClaudeClient VERBOSE`
+    private val verboseLogging: Boolean
+        get() = Log.isLoggable(TAG, Log.VERBOSE)
+
+    // Last serialized tools array, keyed by the schema list it was built from
+    @Volatile
+    private var toolsJsonCache: Pair<List<Map<String, Any>>, JsonArray>? = null
+
+    private val client = baseClient.newBuilder()
         .connectTimeout(30, TimeUnit.SECONDS)
         .readTimeout(60, TimeUnit.SECONDS)
         .writeTimeout(30, TimeUnit.SECONDS)
@@ -45,6 +64,7 @@ class ClaudeClient(private var apiKey: String) {
 
     /**
      * Send a chat request to Claude and return the response.
+     * Main-safe: the blocking HTTP round-trip runs on [Dispatchers.IO].
      *
      * @param messages Conversation history
      * @param tools Tool schemas to pass to Claude
@@ -56,10 +76,50 @@ class ClaudeClient(private var apiKey: String) {
         messages: List<Message>,
         tools: List<Map<String, Any>> = emptyList(),
         systemPrompt: String = ""
-    ): ChatResponse {
-        val requestBody = buildRequestBody(messages, tools, systemPrompt)
+    ): ChatResponse = withContext(Dispatchers.IO) {
+        val response = execute(buildRequestBody(messages, tools, systemPrompt))
+        val responseBody = response.body?.string() ?: throw ClaudeException("Empty response body")
+
+        if (!response.isSuccessful) {
+            throw apiError(response.code, responseBody)
+        }
+
+        if (verboseLogging) Log.v(TAG, "Response: $responseBody")
+        parseResponse(responseBody)
+    }
+
+    /**
+     * Like [chat], but streams the response and hands each text delta to [onText]
+     * as soon as it arrives, so callers can start speaking before Claude finishes.
+     * Main-safe; [onText] is invoked on an IO thread.
+     *
+     * @return ChatResponse assembled from the full stream
+     */
+    @Throws(ClaudeException::class)
+    suspend fun chatStream(
+        messages: List<Message>,
+        tools: List<Map<String, Any>> = emptyList(),
+        systemPrompt: String = "",
+        onText: (String) -> Unit
+    ): ChatResponse = withContext(Dispatchers.IO) {
+        execute(buildRequestBody(messages, tools, systemPrompt, stream = true)).use { response ->
+            val body = response.body ?: throw ClaudeException("Empty response body")
+
+            if (!response.isSuccessful) {
+                throw apiError(response.code, body.string())
+            }
+
+            try {
+                parseStream(body.source(), onText)
+            } catch (e: IOException) {
+                throw ClaudeException("Network error: ${e.message}", e)
+            }
+        }
+    }
+
+    private fun execute(requestBody: String): Response {
         Log.d(TAG, "Sending request to Claude API")
-        Log.v(TAG, "Request: $requestBody")
+        if (verboseLogging) Log.v(TAG, "Request: $requestBody")
 
         val request = Request.Builder()
             .url(BASE_URL)
@@ -69,27 +129,22 @@ class ClaudeClient(private var apiKey: String) {
             .post(requestBody.toRequestBody("application/json".toMediaType()))
             .build()
 
-        val response = try {
+        return try {
             client.newCall(request).execute()
         } catch (e: IOException) {
             throw ClaudeException("Network error: ${e.message}", e)
         }
+    }
 
-        val responseBody = response.body?.string() ?: throw ClaudeException("Empty response body")
-
-        if (!response.isSuccessful) {
-            Log.e(TAG, "Claude API error ${response.code}: $responseBody")
-            val errorMsg = try {
-                val json = JsonParser.parseString(responseBody).asJsonObject
-                json.getAsJsonObject("error")?.get("message")?.asString ?: "Unknown error"
-            } catch (e: Exception) {
-                responseBody
-            }
-            throw ClaudeException("API error ${response.code}: $errorMsg")
+    private fun apiError(code: Int, responseBody: String): ClaudeException {
+        Log.e(TAG, "Claude API error $code: $responseBody")
+        val errorMsg = try {
+            val json = JsonParser.parseString(responseBody).asJsonObject
+            json.getAsJsonObject("error")?.get("message")?.asString ?: "Unknown error"
+        } catch (e: Exception) {
+            responseBody
         }
-
-        Log.v(TAG, "Response: $responseBody")
-        return parseResponse(responseBody)
+        return ClaudeException("API error $code: $errorMsg")
     }
 
     /**
@@ -99,11 +154,13 @@ class ClaudeClient(private var apiKey: String) {
     private fun buildRequestBody(
         messages: List<Message>,
         tools: List<Map<String, Any>>,
-        systemPrompt: String
+        systemPrompt: String,
+        stream: Boolean = false
     ): String {
         val root = JsonObject()
         root.addProperty("model", MODEL)
         root.addProperty("max_tokens", MAX_TOKENS)
+        if (stream) root.addProperty("stream", true)
 
         if (systemPrompt.isNotBlank()) {
             root.addProperty("system", systemPrompt)
@@ -119,17 +176,31 @@ class ClaudeClient(private var apiKey: String) {
 
         // Build tools array
         if (tools.isNotEmpty()) {
-            val toolsArray = JsonArray()
-            for (tool in tools) {
-                val toolObj = gson.toJsonTree(tool).asJsonObject
-                toolsArray.add(toolObj)
-            }
-            root.add("tools", toolsArray)
+            root.add("tools", buildToolsArray(tools))
         }
 
         return root.toString()
     }
 
+    /**
+     * Serialize tool schemas to JSON.
+     * ToolRegistry hands out the same list every call, so the result is reused
+     * across requests instead of re-walking every schema map through Gson.
+     */
+    private fun buildToolsArray(tools: List<Map<String, Any>>): JsonArray {
+        toolsJsonCache?.let { (cachedTools, cachedArray) ->
+            if (cachedTools === tools) return cachedArray
+        }
+
+        val toolsArray = JsonArray()
+        for (tool in tools) {
+            val toolObj = gson.toJsonTree(tool).asJsonObject
+            toolsArray.add(toolObj)
+        }
+        toolsJsonCache = tools to toolsArray
+        return toolsArray
+    }
+
     /**
      * Convert a Message to Anthropic's content block format.
      *
@@ -202,14 +273,14 @@ class ClaudeClient(private var apiKey: String) {
         val json = JsonParser.parseString(responseBody).asJsonObject
         val contentArray = json.getAsJsonArray("content")
 
-        var text: String? = null
+        val textBlocks = mutableListOf<String>()
         val toolCalls = mutableListOf<ToolCall>()
 
         for (element in contentArray) {
             val block = element.asJsonObject
             when (val type = block.get("type")?.asString) {
                 "text" -> {
-                    text = block.get("text")?.asString
+                    block.get("text")?.asString?.let(textBlocks::add)
                 }
                 "tool_use" -> {
                     val id = block.get("id")?.asString ?: continue
@@ -222,6 +293,8 @@ class ClaudeClient(private var apiKey: String) {
             }
         }
 
+        // Text blocks are joined the same way parseStream joins them
+        val text = textBlocks.joinToString("\n").ifEmpty { null }
         Log.d(TAG, "Parsed response: text=${text?.take(100)}, toolCalls=${toolCalls.map { it.name }}")
         return ChatResponse(
             text = text,
@@ -229,6 +302,83 @@ class ClaudeClient(private var apiKey: String) {
         )
     }
 
+    /**
+     * Parse a server-sent event stream from the Messages API.
+     * Text deltas are forwarded to [onText] as they arrive, with a newline between
+     * text blocks; tool_use input JSON is accumulated per content block and parsed
+     * when that block stops. The returned text is exactly what [onText] received.
+     */
+    private fun parseStream(source: BufferedSource, onText: (String) -> Unit): ChatResponse {
+        val text = StringBuilder()
+        var textBlocks = 0
+        val toolCalls = mutableListOf<ToolCall>()
+        // Content block index → (tool_use id, name, partial input JSON)
+        val pendingTools = mutableMapOf<Int, Triple<String, String, StringBuilder>>()
+        var stopped = false
+
+        while (!stopped) {
+            val line = source.readUtf8Line() ?: break
+            if (!line.startsWith("data:")) continue
+
+            val event = JsonParser.parseString(line.removePrefix("data:").trim()).asJsonObject
+            val index = event.get("index")?.asInt ?: -1
+            when (event.get("type")?.asString) {
+                "content_block_start" -> {
+                    val block = event.getAsJsonObject("content_block")
+                    when (block.get("type")?.asString) {
+                        "text" -> {
+                            if (textBlocks++ > 0) {
+                                text.append('\n')
+                                onText("\n")
+                            }
+                        }
+                        "tool_use" -> {
+                            val id = block.get("id")?.asString ?: continue
+                            val name = block.get("name")?.asString ?: continue
+                            pendingTools[index] = Triple(id, name, StringBuilder())
+                        }
+                    }
+                }
+                "content_block_delta" -> {
+                    val delta = event.getAsJsonObject("delta")
+                    when (delta.get("type")?.asString) {
+                        "text_delta" -> {
+                            val chunk = delta.get("text")?.asString ?: continue
+                            text.append(chunk)
+                            onText(chunk)
+                        }
+                        "input_json_delta" -> {
+                            pendingTools[index]?.third?.append(delta.get("partial_json")?.asString ?: "")
+                        }
+                    }
+                }
+                "content_block_stop" -> {
+                    pendingTools.remove(index)?.let { (id, name, json) ->
+                        val input = if (json.isBlank()) emptyMap() else parseToolInput(JsonParser.parseString(json.toString()))
+                        toolCalls.add(ToolCall(id = id, name = name, input = input))
+                    }
+                }
+                "message_stop" -> stopped = true
+                "error" -> {
+                    val message = event.getAsJsonObject("error")?.get("message")?.asString ?: "Unknown error"
+                    throw ClaudeException("Stream error: $message")
+                }
+            }
+        }
+
+        // A dropped connection ends the source early; don't pass a cut-off reply off as complete
+        if (!stopped || pendingTools.isNotEmpty()) {
+            throw ClaudeException("Stream ended unexpectedly")
+        }
+
+        Log.d(TAG, "Parsed stream: text=${text.take(100)}, toolCalls=${toolCalls.map { it.name }}")
+        if (verboseLogging) Log.v(TAG, "Response: text=$text, toolCalls=$toolCalls")
+        return ChatResponse(
+            text = text.toString().ifEmpty { null },
+            toolCalls = if (toolCalls.isNotEmpty()) toolCalls else null
+        )
+    }
+
     /**
      * Recursively parse a JSON element into a Map<String, Any>.
      */
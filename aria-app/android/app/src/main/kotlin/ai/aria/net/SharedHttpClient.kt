@@ -0,0 +1,14 @@
+package ai.aria.os.net
+
+import okhttp3.OkHttpClient
+
+/**
+ * SharedHttpClient — the single OkHttpClient behind all of Aria's HTTP traffic.
+ *
+ * ClaudeClient and the network-backed tools share its connection pool and dispatcher,
+ * so repeat calls reuse warm TCP/TLS connections. Callers that need different timeouts
+ * derive a client with newBuilder(), which keeps the same pool.
+ */
+object SharedHttpClient {
+    val instance: OkHttpClient by lazy { OkHttpClient() }
+}
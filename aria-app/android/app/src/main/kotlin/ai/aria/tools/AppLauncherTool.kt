@@ -2,7 +2,9 @@ package ai.aria.os.tools
 
 import android.content.Context
 import android.content.Intent
+import android.content.pm.PackageManager
 import android.content.pm.ResolveInfo
+import android.os.SystemClock
 import android.util.Log
 import ai.aria.os.tools.base.AriaTool
 
@@ -13,8 +15,12 @@ class AppLauncherTool(private val context: Context) : AriaTool() {
 
     companion object {
         const val TAG = "AppLauncherTool"
+        const val APP_LIST_TTL_MS = 30_000L
     }
 
+    @Volatile
+    private var appListCache: Pair<Long, List<Pair<ResolveInfo, String>>>? = null
+
     override val description = "Launch an installed app by name (e.g., 'Spotify', 'Gmail', 'Maps') " +
         "or by package name (e.g., 'com.spotify.music')."
 
@@ -42,35 +48,34 @@ class AppLauncherTool(private val context: Context) : AriaTool() {
             return "✅ Launched $appName"
         }
 
-        // Search by label name
-        val launchIntent = Intent(Intent.ACTION_MAIN).apply {
-            addCategory(Intent.CATEGORY_LAUNCHER)
-        }
-        val apps: List<ResolveInfo> = pm.queryIntentActivities(launchIntent, 0)
-
+        // Search by label name; a cached list that misses is refreshed once in case the app is new
         val query = appName.lowercase()
-        val match = apps.firstOrNull { info ->
-            val label = info.loadLabel(pm).toString().lowercase()
-            label.contains(query) || query.contains(label)
+        val (firstApps, fromCache) = launchableApps(pm)
+        var apps = firstApps
+        var match = findByLabel(apps, query)
+        if (match == null && fromCache) {
+            apps = launchableApps(pm, forceRefresh = true).first
+            match = findByLabel(apps, query)
         }
 
         if (match != null) {
-            val packageName = match.activityInfo.packageName
+            val (info, label) = match
+            val packageName = info.activityInfo.packageName
             val launchable = pm.getLaunchIntentForPackage(packageName)
             if (launchable != null) {
                 launchable.addFlags(Intent.FLAG_ACTIVITY_NEW_TASK)
                 context.startActivity(launchable)
-                val label = match.loadLabel(pm).toString()
                 Log.i(TAG, "Launched '$label' ($packageName)")
                 return "✅ Launched $label"
             }
         }
 
         // Suggest close matches
+        val prefix = query.take(3)
         val suggestions = apps
-            .filter { it.loadLabel(pm).toString().lowercase().contains(query.take(3)) }
+            .map { (_, label) -> label }
+            .filter { it.lowercase().contains(prefix) }
             .take(3)
-            .map { it.loadLabel(pm).toString() }
 
         return if (suggestions.isNotEmpty()) {
             "App '$appName' not found. Did you mean: ${suggestions.joinToString(", ")}?"
@@ -78,4 +83,38 @@ class AppLauncherTool(private val context: Context) : AriaTool() {
             "App '$appName' not found. Make sure it's installed on the device."
         }
     }
+
+    /**
+     * Launcher activities paired with their labels. Querying PackageManager and
+     * loading every label is the slow part of a launch, so the list is reused
+     * for APP_LIST_TTL_MS.
+     *
+     * @return the list, and whether it was served from the cache rather than freshly queried
+     */
+    private fun launchableApps(
+        pm: PackageManager,
+        forceRefresh: Boolean = false
+    ): Pair<List<Pair<ResolveInfo, String>>, Boolean> {
+        val now = SystemClock.elapsedRealtime()
+        if (!forceRefresh) {
+            appListCache?.let { (loadedAt, apps) ->
+                if (now - loadedAt < APP_LIST_TTL_MS) return apps to true
+            }
+        }
+
+        val launchIntent = Intent(Intent.ACTION_MAIN).apply {
+            addCategory(Intent.CATEGORY_LAUNCHER)
+        }
+        val apps = pm.queryIntentActivities(launchIntent, 0).map { info ->
+            info to info.loadLabel(pm).toString()
+        }
+        appListCache = now to apps
+        return apps to false
+    }
+
+    private fun findByLabel(apps: List<Pair<ResolveInfo, String>>, query: String): Pair<ResolveInfo, String>? =
+        apps.firstOrNull { (_, label) ->
+            val lower = label.lowercase()
+            lower.contains(query) || query.contains(lower)
+        }
 }
@@ -17,6 +17,8 @@ class ContactsTool(private val context: Context) : AriaTool() {
 
     private val gson = Gson()
 
+    override val runsConcurrently = true
+
     override val description = "Search contacts by name or get contact details including phone number and email. " +
         "Returns a list of matching contacts."
 
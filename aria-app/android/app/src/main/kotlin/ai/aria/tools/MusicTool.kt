@@ -17,8 +17,9 @@ class MusicTool(private val context: Context) : AriaTool() {
         const val TAG = "MusicTool"
     }
 
-    private val audioManager: AudioManager =
+    private val audioManager: AudioManager by lazy {
         context.getSystemService(Context.AUDIO_SERVICE) as AudioManager
+    }
 
     override val description = "Control music/media playback. Supports: play, pause, next track, " +
         "previous track, stop, volume up, volume down."
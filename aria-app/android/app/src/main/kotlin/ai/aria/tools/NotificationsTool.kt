@@ -1,10 +1,12 @@
 package ai.aria.os.tools
 
 import android.content.Context
+import android.os.SystemClock
 import android.util.Log
 import com.google.gson.Gson
 import ai.aria.os.accessibility.AriaAccessibilityService
 import ai.aria.os.tools.base.AriaTool
+import kotlinx.coroutines.delay
 
 /**
  * NotificationsTool — retrieves current notifications using the Accessibility Service.
@@ -16,6 +18,17 @@ class NotificationsTool(private val context: Context) : AriaTool() {
 
     companion object {
         const val TAG = "NotificationsTool"
+        const val SYSTEM_UI_PACKAGE = "com.android.systemui"
+        const val SHADE_TIMEOUT_MS = 800L
+        const val SHADE_POLL_MS = 50L
+        const val SHADE_SETTLE_MS = 150L
+
+        // Notification shade chrome that should not be reported as notifications
+        private val SYSTEM_KEYWORDS = listOf(
+            "clear all", "manage", "notification",
+            "settings", "silence", "snooze",
+            "drag down", "notifications"
+        )
     }
 
     private val gson = Gson()
@@ -50,12 +63,8 @@ class NotificationsTool(private val context: Context) : AriaTool() {
                 return "Could not open notification shade. Make sure Aria Accessibility Service is enabled."
             }
 
-            // Brief pause for the shade to animate open
-            Thread.sleep(800)
-
-            // Read the screen content
-            val screenText = service.getScreenText()
-            val snapshot = service.getScreenSnapshot()
+            // Read the shade once it is in front and has finished laying out
+            val screenText = readNotificationShade(service)
 
             // Close notification shade
             service.pressBack()
@@ -65,7 +74,7 @@ class NotificationsTool(private val context: Context) : AriaTool() {
             }
 
             // Parse the screen text into structured notifications
-            val notifications = parseNotificationText(screenText, snapshot, limit)
+            val notifications = parseNotificationText(screenText, limit)
 
             if (notifications.isEmpty()) {
                 "No notifications currently active."
@@ -79,35 +88,51 @@ class NotificationsTool(private val context: Context) : AriaTool() {
         }
     }
 
-    private fun parseNotificationText(
-        text: String,
-        snapshot: List<Map<String, String>>,
-        limit: Int
-    ): List<Map<String, String>> {
+    /**
+     * Wait for the notification shade to open and return its text. System UI becomes the
+     * active window as soon as the expand animation starts, so once it is in front the
+     * shade is re-read until two reads SHADE_SETTLE_MS apart match. Gives up after
+     * SHADE_TIMEOUT_MS and reads whatever is on screen. Suspends instead of blocking.
+     */
+    private suspend fun readNotificationShade(service: AriaAccessibilityService): String {
+        val deadline = SystemClock.uptimeMillis() + SHADE_TIMEOUT_MS
+        var previous: String? = null
+        while (SystemClock.uptimeMillis() < deadline) {
+            if (service.getCurrentApp() != SYSTEM_UI_PACKAGE) {
+                delay(SHADE_POLL_MS)
+                continue
+            }
+            val text = service.getScreenText()
+            if (text.isNotBlank() && text == previous) return text
+            previous = text
+            delay(SHADE_SETTLE_MS)
+        }
+        Log.d(TAG, "Notification shade not settled after ${SHADE_TIMEOUT_MS}ms, reading anyway")
+        return service.getScreenText()
+    }
+
+    private fun parseNotificationText(text: String, limit: Int): List<Map<String, String>> {
         val notifications = mutableListOf<Map<String, String>>()
 
         // Filter out system UI elements and extract meaningful notification text
-        val systemKeywords = listOf(
-            "clear all", "manage", "notification",
-            "settings", "silence", "snooze",
-            "drag down", "notifications"
-        )
-
         val lines = text.split("\n")
             .map { it.trim() }
             .filter { line ->
-                line.length > 3 &&
-                    !systemKeywords.any { keyword -> line.lowercase().contains(keyword) }
+                line.length > 3 && line.lowercase().let { lower ->
+                    SYSTEM_KEYWORDS.none { keyword -> lower.contains(keyword) }
+                }
             }
 
-        // Group into chunks of 2-3 lines per notification
+        // Group into pairs of lines per notification, indexing in place rather than copying the tail
         var i = 0
         while (i < lines.size && notifications.size < limit) {
-            val notifText = lines.drop(i).take(2).joinToString(" — ")
+            val first = lines[i]
+            val second = lines.getOrNull(i + 1)
+            val notifText = if (second != null) "$first — $second" else first
             if (notifText.isNotBlank()) {
                 notifications.add(mapOf(
-                    "app" to (lines.getOrNull(i)?.take(30) ?: "Unknown"),
-                    "text" to (lines.getOrNull(i + 1) ?: notifText).take(100)
+                    "app" to first.take(30),
+                    "text" to (second ?: notifText).take(100)
                 ))
             }
             i += 2
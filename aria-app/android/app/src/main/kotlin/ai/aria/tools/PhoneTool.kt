@@ -38,7 +38,7 @@ class PhoneTool(private val context: Context) : AriaTool() {
         val phoneNumber = if (to.any { it.isLetter() }) {
             resolveContact(to) ?: return "Error: Could not find contact '$to'. Please try a phone number."
         } else {
-            to.replace(Regex("[^0-9+]"), "")
+            to.replace(AriaTool.NON_PHONE_CHARS, "")
         }
 
         return try {
@@ -71,7 +71,7 @@ class PhoneTool(private val context: Context) : AriaTool() {
         cursor?.use {
             if (it.moveToFirst()) {
                 val number = it.getString(it.getColumnIndexOrThrow(ContactsContract.CommonDataKinds.Phone.NUMBER))
-                return number.replace(Regex("[^0-9+]"), "")
+                return number.replace(AriaTool.NON_PHONE_CHARS, "")
             }
         }
         return null
@@ -19,8 +19,9 @@ class SettingsTool(private val context: Context) : AriaTool() {
         const val TAG = "SettingsTool"
     }
 
-    private val audioManager: AudioManager =
+    private val audioManager: AudioManager by lazy {
         context.getSystemService(Context.AUDIO_SERVICE) as AudioManager
+    }
 
     override val description = "Change device settings. Supports: brightness, volume, wifi, bluetooth, " +
         "airplane_mode, flashlight, do_not_disturb, ringer_mode."
@@ -46,7 +46,7 @@ class SmsTool(private val context: Context) : AriaTool() {
         val phoneNumber = if (to.any { it.isLetter() }) {
             resolveContact(to) ?: return "Error: Could not find contact '$to'. Please try a different name or use a phone number directly."
         } else {
-            to.replace(Regex("[^0-9+]"), "")
+            to.replace(AriaTool.NON_PHONE_CHARS, "")
         }
 
         return try {
@@ -79,7 +79,7 @@ class SmsTool(private val context: Context) : AriaTool() {
             if (it.moveToFirst()) {
                 val number = it.getString(it.getColumnIndexOrThrow(ContactsContract.CommonDataKinds.Phone.NUMBER))
                 Log.d(TAG, "Resolved '$name' → $number")
-                return number.replace(Regex("[^0-9+]"), "")
+                return number.replace(AriaTool.NON_PHONE_CHARS, "")
             }
         }
         return null
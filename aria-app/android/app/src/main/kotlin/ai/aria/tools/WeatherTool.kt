@@ -1,10 +1,12 @@
 package ai.aria.os.tools
 
 import android.content.Context
+import android.os.SystemClock
 import android.util.Log
+import android.util.LruCache
 import com.google.gson.JsonParser
+import ai.aria.os.net.SharedHttpClient
 import ai.aria.os.tools.base.AriaTool
-import okhttp3.OkHttpClient
 import okhttp3.Request
 import java.net.URLEncoder
 
@@ -13,6 +15,9 @@ import java.net.URLEncoder
  *
  * Step 1: Geocode location name → lat/lon via Open-Meteo's geocoding API
  * Step 2: Fetch weather data from Open-Meteo weather API
+ *
+ * Geocoding results are cached for the life of the tool (place coordinates don't move);
+ * weather reports are cached for WEATHER_TTL_MS so repeat questions skip the network.
  */
 class WeatherTool(private val context: Context) : AriaTool() {
 
@@ -20,9 +25,17 @@ class WeatherTool(private val context: Context) : AriaTool() {
         const val TAG = "WeatherTool"
         const val GEO_URL = "https://geocoding-api.open-meteo.com/v1/search"
         const val WEATHER_URL = "https://api.open-meteo.com/v1/forecast"
+        const val WEATHER_TTL_MS = 5 * 60 * 1000L
+        const val CACHE_SIZE = 32
     }
 
-    private val client = OkHttpClient()
+    private val client = SharedHttpClient.instance
+
+    // LruCache is synchronized, so both are safe for concurrent tool calls
+    private val geoCache = LruCache<String, Triple<Double, Double, String>>(CACHE_SIZE)
+    private val weatherCache = LruCache<String, Pair<Long, String>>(CACHE_SIZE)
+
+    override val runsConcurrently = true
 
     override val description = "Get current weather conditions and forecast for any location. " +
         "No API key required. Provides temperature, conditions, humidity, and wind."
@@ -50,11 +63,25 @@ class WeatherTool(private val context: Context) : AriaTool() {
         if (location.isBlank()) return "Error: 'location' is required"
 
         // Step 1: Geocode
-        val (lat, lon, resolvedName) = geocode(location)
+        val geoKey = location.trim().lowercase()
+        val (lat, lon, resolvedName) = geoCache.get(geoKey)
+            ?: geocode(location)?.also { geoCache.put(geoKey, it) }
             ?: return "Error: Could not find location '$location'. Try a major city name."
 
-        // Step 2: Fetch weather
-        return fetchWeather(lat, lon, resolvedName, days)
+        // Step 2: Fetch weather, reusing a recent report for the same place and range
+        val weatherKey = "$lat,$lon,$days"
+        weatherCache.get(weatherKey)?.let { (fetchedAt, report) ->
+            if (SystemClock.elapsedRealtime() - fetchedAt < WEATHER_TTL_MS) {
+                Log.d(TAG, "Weather cache hit for $resolvedName")
+                return report
+            }
+        }
+
+        val report = fetchWeather(lat, lon, resolvedName, days)
+        if (!report.startsWith("Error")) {
+            weatherCache.put(weatherKey, SystemClock.elapsedRealtime() to report)
+        }
+        return report
     }
 
     private fun geocode(location: String): Triple<Double, Double, String>? {
@@ -3,8 +3,8 @@ package ai.aria.os.tools
 import android.content.Context
 import android.util.Log
 import com.google.gson.JsonParser
+import ai.aria.os.net.SharedHttpClient
 import ai.aria.os.tools.base.AriaTool
-import okhttp3.OkHttpClient
 import okhttp3.Request
 import java.net.URLEncoder
 
@@ -19,7 +19,9 @@ class WebSearchTool(private val context: Context) : AriaTool() {
         const val DDG_API = "https://api.duckduckgo.com/"
     }
 
-    private val client = OkHttpClient()
+    private val client = SharedHttpClient.instance
+
+    override val runsConcurrently = true
 
     override val description = "Search the web for information and get a summarized answer. " +
         "Uses DuckDuckGo. Good for facts, news, and quick lookups."
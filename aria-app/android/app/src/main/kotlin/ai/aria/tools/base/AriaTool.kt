@@ -12,6 +12,11 @@ package ai.aria.os.tools.base
  */
 abstract class AriaTool {
 
+    companion object {
+        /** Anything that isn't a digit or '+'; stripped from phone numbers before they're used. */
+        val NON_PHONE_CHARS = Regex("[^0-9+]")
+    }
+
     /** Human-readable description for Claude */
     abstract val description: String
 
@@ -21,6 +26,16 @@ abstract class AriaTool {
      */
     abstract val inputSchema: Map<String, Any>
 
+    /**
+     * True if the tool can run alongside other tool calls from the same Claude turn.
+     * Only set this when both hold:
+     * - the tool never drives the foreground UI
+     * - execute() is safe to run concurrently with itself and with other tools, e.g. it
+     *   shares no mutable or non-thread-safe state such as a SimpleDateFormat field
+     * Everything else stays sequential.
+     */
+    open val runsConcurrently: Boolean = false
+
     /**
      * Execute the tool with the given input map.
      * @param input Key-value pairs from Claude's tool call
@@ -14,17 +14,32 @@ import java.util.UUID
  * - US English voice
  * - Slightly faster speech rate (1.1x)
  * - Utterance completion callbacks
+ * - Sentence-by-sentence speech of streamed replies
  * - Graceful handling of TTS initialization failure
  */
 class AriaVoice(private val context: Context) {
 
     companion object {
         const val TAG = "AriaVoice"
+
+        // Markdown stripping patterns, compiled once instead of on every utterance
+        private val BOLD_ITALIC = Regex("\\*{1,3}(.*?)\\*{1,3}")
+        private val CODE = Regex("`{1,3}(.*?)`{1,3}")
+        private val HEADER = Regex("#+ ")
+        private val LINK = Regex("\\[(.+?)\\]\\(.+?\\)")
     }
 
     private var tts: TextToSpeech? = null
+    @Volatile
     private var initialized = false
-    private val pendingQueue = mutableListOf<String>()
+
+    // Each utterance flushes the one before it, so only the latest request is worth keeping.
+    // Guarded by this object's lock, like the stream state below.
+    private var pendingUtterance: String? = null
+
+    // Streamed reply text not yet spoken, and whether the current reply has started speaking
+    private val streamBuffer = StringBuilder()
+    private var streamSpoken = false
 
     var onSpeakingStart: (() -> Unit)? = null
     var onSpeakingEnd: (() -> Unit)? = null
@@ -65,12 +80,15 @@ class AriaVoice(private val context: Context) {
                     }
                 })
 
-                initialized = true
-                Log.i(TAG, "TTS initialized successfully")
+                // Locked like speak(), so a request can't land in the slot after it's flushed
+                synchronized(this@AriaVoice) {
+                    initialized = true
+                    Log.i(TAG, "TTS initialized successfully")
 
-                // Flush any pending utterances
-                pendingQueue.forEach { text -> speakNow(text) }
-                pendingQueue.clear()
+                    // Speak the most recent utterance requested during init
+                    pendingUtterance?.let { text -> speakNow(text) }
+                    pendingUtterance = null
+                }
 
             } else {
                 Log.e(TAG, "TTS initialization failed with status: $status")
@@ -80,27 +98,102 @@ class AriaVoice(private val context: Context) {
 
     /**
      * Speak the given text aloud.
-     * If TTS isn't initialized yet, queues the text.
+     * If TTS isn't initialized yet, holds the text (replacing any older pending utterance).
+     * Discards any partially streamed reply.
      */
+    @Synchronized
     fun speak(text: String) {
+        streamBuffer.clear()
+        streamSpoken = false
         if (!initialized) {
-            Log.d(TAG, "TTS not ready, queuing: ${text.take(50)}")
-            pendingQueue.add(text)
+            Log.d(TAG, "TTS not ready, holding: ${text.take(50)}")
+            pendingUtterance = text
             return
         }
         speakNow(text)
     }
 
-    private fun speakNow(text: String) {
+    /**
+     * Feed the next chunk of a streamed reply. Each complete sentence is spoken as soon
+     * as it arrives, queued behind the previous one, so speech starts before the reply
+     * has finished generating. Call [finishStreamed] when the stream ends.
+     */
+    @Synchronized
+    fun speakStreamed(chunk: String) {
+        streamBuffer.append(chunk)
+        val end = lastSentenceEnd(streamBuffer)
+        if (end == 0) return
+
+        val sentences = streamBuffer.substring(0, end).trim()
+        streamBuffer.delete(0, end)
+        speakQueued(sentences)
+    }
+
+    /**
+     * Speak whatever is left of the streamed text so far without ending the reply.
+     * Call when one streamed response ends but the reply continues in another, so
+     * the tail of the first isn't run together with the start of the next.
+     */
+    @Synchronized
+    fun flushStreamed() {
+        val rest = streamBuffer.toString().trim()
+        streamBuffer.clear()
+        speakQueued(rest)
+    }
+
+    /**
+     * End the current streamed reply, speaking any trailing partial sentence.
+     * @return true if any part of the reply was spoken
+     */
+    @Synchronized
+    fun finishStreamed(): Boolean {
+        flushStreamed()
+
+        val spoken = streamSpoken
+        streamSpoken = false
+        return spoken
+    }
+
+    private fun speakQueued(text: String) {
+        if (text.isEmpty()) return
+
+        // The first sentence of a reply interrupts earlier speech; the rest queue behind it
+        val queueMode = if (streamSpoken) TextToSpeech.QUEUE_ADD else TextToSpeech.QUEUE_FLUSH
+        streamSpoken = true
+
+        if (!initialized) {
+            pendingUtterance = if (queueMode == TextToSpeech.QUEUE_ADD) {
+                listOfNotNull(pendingUtterance, text).joinToString(" ")
+            } else {
+                text
+            }
+            return
+        }
+        speakNow(text, queueMode)
+    }
+
+    /** Index just past the last sentence boundary in [text], or 0 if there is none yet. */
+    private fun lastSentenceEnd(text: CharSequence): Int {
+        for (i in text.length - 1 downTo 0) {
+            val c = text[i]
+            if (c == '\n') return i + 1
+            if ((c == '.' || c == '!' || c == '?') && i + 1 < text.length && text[i + 1].isWhitespace()) {
+                return i + 1
+            }
+        }
+        return 0
+    }
+
+    private fun speakNow(text: String, queueMode: Int = TextToSpeech.QUEUE_FLUSH) {
         // Strip markdown formatting for cleaner speech
         val cleanText = text
-            .replace(Regex("\\*{1,3}(.*?)\\*{1,3}"), "$1")   // bold/italic
-            .replace(Regex("`{1,3}(.*?)`{1,3}"), "$1")        // code
-            .replace(Regex("#+ "), "")                          // headers
-            .replace(Regex("\\[(.+?)\\]\\(.+?\\)"), "$1")     // links
+            .replace(BOLD_ITALIC, "$1")
+            .replace(CODE, "$1")
+            .replace(HEADER, "")
+            .replace(LINK, "$1")
 
         val utteranceId = UUID.randomUUID().toString()
-        tts?.speak(cleanText, TextToSpeech.QUEUE_FLUSH, null, utteranceId)
+        tts?.speak(cleanText, queueMode, null, utteranceId)
         Log.d(TAG, "Speaking: ${cleanText.take(80)}")
     }
 